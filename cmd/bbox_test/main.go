@@ -215,9 +215,13 @@ Also provide a description of the scene.`
 	// Annotate using normalized 1000 scaling
 	log.Printf("\n========== ANNOTATING WITH NORMALIZED 1000 SCALING ==========")
 
-	// Pass the raw normalized 1000 response directly to AnnotateFrame
+	// Pass the parsed normalized 1000 response directly to AnnotateFrame
 	// AnnotateFrame will handle the scaling
-	annotatedData, err := webrtc.AnnotateFrame(imageBytes, vlmResp.Choices[0].Message.Content)
+	var annotResp webrtc.VLMResponse
+	if err := json.Unmarshal([]byte(vlmResp.Choices[0].Message.Content), &annotResp); err != nil {
+		log.Fatalf("Failed to parse response for annotation: %v", err)
+	}
+	annotatedData, err := webrtc.AnnotateFrame(imageBytes, &annotResp)
 	if err != nil {
 		log.Fatalf("Failed to annotate frame: %v", err)
 	}
@@ -84,8 +84,9 @@ func main() {
 
 	// Create VLM frame client and batch manager (for VLM summarization)
 	vlmTimeout := time.Duration(config.VLMTimeoutSec) * time.Second
-	frameClient := webrtc.NewFrameClient(config.VLMOpenAIBaseURL, config.VLMOpenAIModel, config.VLMOpenAIAPIKey, vlmTimeout, "Summarize the video")
-	batchManager := webrtc.NewBatchManager(frameClient, config.FrameBatchSize, storage, dbClient, eventService.GetBroadcaster())
+	frameClient := webrtc.NewFrameClient(config.VLMOpenAIBaseURL, config.VLMOpenAIModel, config.VLMOpenAIAPIKey, vlmTimeout, config.VLMMaxTokens, "Summarize the video")
+	frameBatchMaxWait := time.Duration(config.FrameBatchMaxWaitSec) * time.Second
+	batchManager := webrtc.NewBatchManager(frameClient, config.FrameBatchSize, frameBatchMaxWait, storage, dbClient, eventService.GetBroadcaster())
 	log.Printf("[Main] Initialized VLM frame client: url=%s, model=%s, batchSize=%d, timeout=%vs", config.VLMOpenAIBaseURL, config.VLMOpenAIModel, config.FrameBatchSize, config.VLMTimeoutSec)
 
 	// Initialize node server for WebSocket connections
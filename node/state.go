@@ -3,6 +3,8 @@ package node
 import (
 	"fmt"
 	"log"
+	"net/http"
+	"time"
 
 	"github.com/gorilla/websocket"
 	"github.com/zapdos-labs/unblink/shared"
@@ -57,10 +59,19 @@ func NewDisconnectedState() *DisconnectedState {
 }
 
 func (s *DisconnectedState) Connect(c *Conn) error {
-	wsConn, _, err := websocket.DefaultDialer.Dial(c.configFile.Config.RelayAddress, nil)
+	// Larger I/O buffers than the 4KB default: the relay connection carries
+	// CBOR bridge-data messages at video bitrate
+	dialer := websocket.Dialer{
+		Proxy:            http.ProxyFromEnvironment,
+		HandshakeTimeout: 45 * time.Second,
+		ReadBufferSize:   64 * 1024,
+		WriteBufferSize:  64 * 1024,
+	}
+	wsConn, _, err := dialer.Dial(c.configFile.Config.RelayAddress, nil)
 	if err != nil {
 		return err
 	}
+	wsConn.SetReadLimit(MaxMessageSize)
 
 	c.wsConn = wsConn
 	c.transport = &WebSocketConn{conn: wsConn}
@@ -11,6 +11,7 @@ import (
 
 	chatv1 "github.com/zapdos-labs/unblink/server/gen/chat/v1"
 	"github.com/zapdos-labs/unblink/server/gen/chat/v1/chatv1connect"
+	"github.com/zapdos-labs/unblink/server/internal/httputil"
 	"github.com/zapdos-labs/unblink/server/models"
 )
 
@@ -109,8 +110,16 @@ func NewService(db Database, cfg *Config) *Service {
 		return service
 	}
 
+	// One pooled HTTP client shared by both OpenAI clients so chat and
+	// title-generation requests reuse keep-alive connections instead of
+	// opening a fresh TCP+TLS connection per request.
+	httpClient := httputil.NewPooledClient(0)
+
 	// Create main chat client from direct chat config.
-	opts := []option.RequestOption{option.WithAPIKey(cfg.ChatOpenAIAPIKey)}
+	opts := []option.RequestOption{
+		option.WithAPIKey(cfg.ChatOpenAIAPIKey),
+		option.WithHTTPClient(httpClient),
+	}
 	if cfg.ChatOpenAIBaseURL != "" {
 		opts = append(opts, option.WithBaseURL(cfg.ChatOpenAIBaseURL))
 		log.Printf("[ChatService] Using custom base URL: %s", cfg.ChatOpenAIBaseURL)
@@ -119,7 +128,10 @@ func NewService(db Database, cfg *Config) *Service {
 	service.openai = &client
 
 	// Create title-generation client from VLM settings (fallbacks normalized in config load).
-	titleOpts := []option.RequestOption{option.WithAPIKey(cfg.VLMOpenAIAPIKey)}
+	titleOpts := []option.RequestOption{
+		option.WithAPIKey(cfg.VLMOpenAIAPIKey),
+		option.WithHTTPClient(httpClient),
+	}
 	if cfg.VLMOpenAIBaseURL != "" {
 		titleOpts = append(titleOpts, option.WithBaseURL(cfg.VLMOpenAIBaseURL))
 	}
@@ -34,14 +34,16 @@ type Config struct {
 	ChatMaxTokens           int `json:"chat_max_tokens"`
 
 	// Frame extraction settings
-	FrameIntervalSeconds float64 `json:"frame_interval_seconds"` // Extraction interval in seconds
-	FrameBatchSize       int     `json:"frame_batch_size"`       // Frames to batch before sending (buffer size = batch size)
+	FrameIntervalSeconds float64 `json:"frame_interval_seconds"`   // Extraction interval in seconds
+	FrameBatchSize       int     `json:"frame_batch_size"`         // Frames to batch before sending (buffer size = batch size)
+	FrameBatchMaxWaitSec int     `json:"frame_batch_max_wait_sec"` // Max seconds a partial batch waits before being sent
 
 	// VLM OpenAI settings for frame processing
 	VLMOpenAIModel   string `json:"vlm_openai_model"`
 	VLMOpenAIBaseURL string `json:"vlm_openai_base_url"`
 	VLMOpenAIAPIKey  string `json:"vlm_openai_api_key,omitempty"`
 	VLMTimeoutSec    int    `json:"vlm_timeout_sec"` // Request timeout in seconds
+	VLMMaxTokens     int    `json:"vlm_max_tokens"`  // Completion token budget per VLM request
 
 	// Bridge idle detection and reconnection
 	BridgeIdleTimeoutSec int `json:"bridge_idle_timeout_sec"` // How long before bridge is considered idle (seconds)
@@ -116,9 +118,15 @@ func (c *Config) Validate() error {
 	if c.FrameBatchSize <= 0 {
 		missing = append(missing, "frame_batch_size")
 	}
+	if c.FrameBatchMaxWaitSec <= 0 {
+		missing = append(missing, "frame_batch_max_wait_sec")
+	}
 	if c.VLMTimeoutSec <= 0 {
 		missing = append(missing, "vlm_timeout_sec")
 	}
+	if c.VLMMaxTokens <= 0 {
+		missing = append(missing, "vlm_max_tokens")
+	}
 	if c.BridgeIdleTimeoutSec <= 0 {
 		missing = append(missing, "bridge_idle_timeout_sec")
 	}
@@ -178,9 +186,11 @@ func (c *Config) ClipsBaseDir() string {
 //   - VLM_OPENAI_BASE_URL: OpenAI API base URL for vision (falls back to CHAT_OPENAI_BASE_URL)
 //   - VLM_OPENAI_API_KEY: OpenAI API key for vision (falls back to CHAT_OPENAI_API_KEY)
 //   - VLM_TIMEOUT_SEC: VLM request timeout in seconds (default: 120)
+//   - VLM_MAX_TOKENS: Completion token budget per VLM request (default: 2048)
 //   - CONTENT_TRIM_SAFETY_MARGIN: Content trimming safety margin % (default: 10)
 //   - FRAME_INTERVAL_SECONDS: Frame extraction interval (default: 5.0)
 //   - FRAME_BATCH_SIZE: Frame batch size (default: 3)
+//   - FRAME_BATCH_MAX_WAIT_SEC: Max wait before sending a partial batch (default: 15)
 //   - BRIDGE_IDLE_TIMEOUT_SEC: Bridge idle timeout (default: 300)
 //   - BRIDGE_MAX_RETRIES: Bridge max retries (default: 3)
 //   - ENABLE_INDEXING: Enable frame indexing (default: true)
@@ -216,6 +226,7 @@ func LoadConfig() (*Config, error) {
 	cfg.VLMOpenAIAPIKey = os.Getenv("VLM_OPENAI_API_KEY")
 	cfg.applyModelFallbacks()
 	cfg.VLMTimeoutSec = getEnvInt("VLM_TIMEOUT_SEC", 120)
+	cfg.VLMMaxTokens = getEnvInt("VLM_MAX_TOKENS", 2048)
 
 	// Content trimming
 	cfg.ContentTrimSafetyMargin = getEnvInt("CONTENT_TRIM_SAFETY_MARGIN", 10)
@@ -223,6 +234,7 @@ func LoadConfig() (*Config, error) {
 	// Frame extraction
 	cfg.FrameIntervalSeconds = getEnvFloat("FRAME_INTERVAL_SECONDS", 5.0)
 	cfg.FrameBatchSize = getEnvInt("FRAME_BATCH_SIZE", 3)
+	cfg.FrameBatchMaxWaitSec = getEnvInt("FRAME_BATCH_MAX_WAIT_SEC", 15)
 
 	// Bridge settings
 	cfg.BridgeIdleTimeoutSec = getEnvInt("BRIDGE_IDLE_TIMEOUT_SEC", 300)
@@ -0,0 +1,31 @@
+package httputil
+
+import (
+	"net/http"
+	"time"
+)
+
+// NewPooledClient returns an http.Client backed by a transport tuned for
+// many concurrent requests against a small set of hosts (vLLM endpoints,
+// OpenAI-compatible APIs). The default transport only keeps 2 idle
+// connections per host, so concurrent batch requests pay a fresh TCP+TLS
+// handshake each time; raising the idle pool lets keep-alive connections
+// be reused across batches.
+func NewPooledClient(timeout time.Duration) *http.Client {
+	transport := &http.Transport{
+		MaxIdleConns:        64,
+		MaxIdleConnsPerHost: 32,
+		IdleConnTimeout:     90 * time.Second,
+		// Negotiate HTTP/2 where the endpoint supports it so many small
+		// concurrent requests multiplex over one TLS connection instead of
+		// each holding a pooled HTTP/1.1 connection. Explicit so the
+		// upgrade survives someone later adding a custom dialer or TLS
+		// config (which disables the automatic h2 path).
+		ForceAttemptHTTP2: true,
+	}
+
+	return &http.Client{
+		Transport: transport,
+		Timeout:   timeout,
+	}
+}
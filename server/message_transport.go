@@ -28,6 +28,9 @@ type wsMessageTransport struct {
 
 // NewMessageTransport creates a new message transport from a WebSocket connection
 func NewMessageTransport(conn *websocket.Conn) *wsMessageTransport {
+	// Reject oversized messages during the read instead of buffering the
+	// whole payload first
+	conn.SetReadLimit(MaxMessageSize)
 	return &wsMessageTransport{
 		conn: conn,
 	}
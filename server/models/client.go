@@ -6,6 +6,8 @@ import (
 	"log"
 	"net/http"
 	"time"
+
+	"github.com/zapdos-labs/unblink/server/internal/httputil"
 )
 
 // Client fetches model information from OpenAI-compatible /v1/models endpoint
@@ -33,7 +35,7 @@ func NewClient(cfg Config) *Client {
 	}
 
 	return &Client{
-		httpClient: &http.Client{Timeout: 10 * time.Second},
+		httpClient: httputil.NewPooledClient(10 * time.Second),
 		baseURL:    baseURL,
 		apiKey:     cfg.APIKey,
 	}
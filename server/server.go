@@ -113,9 +113,12 @@ func (s *Server) notifyNodeOffline(nodeID string) {
 
 // UpgradeToWebSocket upgrades an HTTP connection to WebSocket
 func (s *Server) UpgradeToWebSocket(w http.ResponseWriter, r *http.Request) (*websocket.Conn, error) {
+	// Larger I/O buffers than the 1KB default: node connections carry CBOR
+	// bridge-data messages at video bitrate, and small buffers mean more
+	// syscalls per message
 	upgrader := websocket.Upgrader{
-		ReadBufferSize:  1024,
-		WriteBufferSize: 1024,
+		ReadBufferSize:  64 * 1024,
+		WriteBufferSize: 64 * 1024,
 		CheckOrigin: func(r *http.Request) bool {
 			return true // Allow all origins in simplified version
 		},
@@ -28,6 +28,10 @@ type ServiceHandler struct {
 	producer     core.Producer // Track producer for cleanup
 	producerDone chan struct{} // Signal when producer goroutine exits
 
+	// Frame preprocessing queue (decouples JPEG decode/resize from extraction)
+	frameCh        chan *webrtc.Frame // Extracted frames awaiting preprocessing
+	preprocessDone chan struct{}      // Signal when preprocessing goroutine exits
+
 	// Shared infrastructure (injected)
 	storage      *webrtc.Storage
 	batchManager *webrtc.BatchManager
@@ -135,29 +139,20 @@ func (h *ServiceHandler) Start() error {
 	}
 
 	if h.enableIndexing {
+		// Preprocess frames on a dedicated goroutine so JPEG decode, resize
+		// and disk writes don't stall the FFmpeg frame reader. A single
+		// worker keeps frames in order for the batch manager; the small
+		// buffer absorbs bursts and drops frames if preprocessing falls
+		// behind (same policy as the batch manager's full buffer).
+		h.frameCh = make(chan *webrtc.Frame, 4)
+
 		// Create and start extractor
 		h.extractor = webrtc.NewFrameExtractor(h.serviceID, h.frameInterval, func(frame *webrtc.Frame) {
-			// Preprocess frame: resize to max 800px edge and burn in timestamp
-			preprocessedData, err := webrtc.PreprocessFrame(frame.Data, frame.Timestamp)
-			if err != nil {
-				log.Printf("[ServiceHandler] Failed to preprocess frame for service %s: %v", h.serviceID, err)
-				// Fall back to original frame if preprocessing fails
-				preprocessedData = frame.Data
-			}
-
-			// Create preprocessed frame
-			preprocessedFrame := &webrtc.Frame{
-				Data:      preprocessedData,
-				Timestamp: frame.Timestamp,
-				ServiceID: frame.ServiceID,
-			}
-
-			// Save preprocessed frame to disk
-			h.storage.Save(h.serviceID, preprocessedFrame)
-
-			// Add preprocessed frame to batch manager for vLLM processing
-			if h.batchManager != nil {
-				h.batchManager.AddFrame(preprocessedFrame)
+			// Non-blocking handoff to the preprocessing goroutine
+			select {
+			case h.frameCh <- frame:
+			default:
+				log.Printf("[ServiceHandler] Preprocess queue full for service %s, dropping frame", h.serviceID)
 			}
 		})
 
@@ -172,6 +167,12 @@ func (h *ServiceHandler) Start() error {
 			nodeConn.CloseBridge(ctx, bridgeID)
 			return fmt.Errorf("failed to start extractor: %w", err)
 		}
+
+		// Spawn the worker only once the extractor is running: the registry
+		// retries failed starts, and a goroutine parked on a discarded
+		// handler's context would leak once per attempt.
+		h.preprocessDone = make(chan struct{})
+		go h.preprocessLoop()
 	} else if h.enableRecording && !clipRecorderStarted {
 		h.mediaSource.Close()
 		h.bridgeConn.Close()
@@ -184,6 +185,43 @@ func (h *ServiceHandler) Start() error {
 	return nil
 }
 
+// preprocessLoop consumes extracted frames and runs the preprocess + store +
+// batch pipeline. Running this off the extractor callback lets frame
+// extraction, preprocessing, and VLM inference overlap.
+func (h *ServiceHandler) preprocessLoop() {
+	defer close(h.preprocessDone)
+
+	for {
+		select {
+		case <-h.ctx.Done():
+			return
+		case frame := <-h.frameCh:
+			// Preprocess frame: resize to max 800px edge and burn in timestamp
+			preprocessedData, err := webrtc.PreprocessFrame(frame.Data, frame.Timestamp)
+			if err != nil {
+				log.Printf("[ServiceHandler] Failed to preprocess frame for service %s: %v", h.serviceID, err)
+				// Fall back to original frame if preprocessing fails
+				preprocessedData = frame.Data
+			}
+
+			// Create preprocessed frame
+			preprocessedFrame := &webrtc.Frame{
+				Data:      preprocessedData,
+				Timestamp: frame.Timestamp,
+				ServiceID: frame.ServiceID,
+			}
+
+			// Save preprocessed frame to disk
+			h.storage.Save(h.serviceID, preprocessedFrame)
+
+			// Add preprocessed frame to batch manager for vLLM processing
+			if h.batchManager != nil {
+				h.batchManager.AddFrame(preprocessedFrame)
+			}
+		}
+	}
+}
+
 // Stop stops all service components and cleans up resources
 func (h *ServiceHandler) Stop() {
 	log.Printf("[ServiceHandler] Stopping handler for service %s", h.serviceID)
@@ -222,15 +260,22 @@ func (h *ServiceHandler) Stop() {
 		h.bridgeConn = nil
 	}
 
+	// Cancel context and wait for the preprocessing goroutine to exit
+	// (extractor is already closed, so no more frames are being enqueued).
+	// This must happen BEFORE RemoveService: a frame drained after removal
+	// would re-create the service's batch state in the manager.
+	if h.cancel != nil {
+		h.cancel()
+	}
+	if h.preprocessDone != nil {
+		<-h.preprocessDone
+		h.preprocessDone = nil
+	}
+
 	// Clean up batch manager context
 	if h.batchManager != nil {
 		h.batchManager.RemoveService(h.serviceID)
 	}
-
-	// Cancel context
-	if h.cancel != nil {
-		h.cancel()
-	}
 }
 
 // GetBridgeConn returns the bridge connection (for idle monitoring)
@@ -3,7 +3,6 @@ package webrtc
 import (
 	"bytes"
 	"crypto/md5"
-	"encoding/json"
 	"fmt"
 	"image"
 	"image/color"
@@ -104,13 +103,19 @@ func hashToBrightColor(s string) color.Color {
 }
 
 // AnnotateFrame draws tags (label and id) at the center of each bounding box
-// Expects VLM to return normalized 1000 coordinates (0-1000)
+// Expects VLM bboxes in normalized 1000 coordinates (0-1000)
+// Takes the already-parsed VLM response so callers don't pay a second
+// JSON unmarshal of the same payload
 // Returns annotated JPEG bytes
-func AnnotateFrame(jpegData []byte, vlmResponse string) ([]byte, error) {
-	// Parse VLM JSON response
-	var resp VLMResponse
-	if err := json.Unmarshal([]byte(vlmResponse), &resp); err != nil {
-		return nil, fmt.Errorf("failed to parse VLM response: %w", err)
+func AnnotateFrame(jpegData []byte, resp *VLMResponse) ([]byte, error) {
+	if resp == nil {
+		return nil, fmt.Errorf("nil VLM response")
+	}
+
+	// Nothing to draw: skip the JPEG decode + re-encode round trip entirely
+	// (re-encoding would only cost CPU and add generation loss)
+	if len(resp.Objects) == 0 {
+		return jpegData, nil
 	}
 
 	// Decode JPEG
@@ -35,31 +35,48 @@ type rollupWindow struct {
 	to   time.Time
 }
 
+// sopCacheEntry caches the rendered SOP instruction for a service so the
+// (effectively constant) prompt prefix isn't rebuilt from two DB queries on
+// every batch
+type sopCacheEntry struct {
+	text      string
+	fetchedAt time.Time
+}
+
+// sopCacheTTL bounds how long SOP edits take to reach the prompt
+const sopCacheTTL = time.Minute
+
 // BatchManager accumulates frames and sends them in batches to vLLM
 // It maintains rolling context per service, asking the model to describe only what's new
 type BatchManager struct {
 	client           *FrameClient
 	batchSize        int
+	maxBatchWait     time.Duration              // Max time a partial batch waits before being sent
 	frameBuffers     map[string][]*Frame        // serviceID -> buffer of frames (max size = batchSize)
 	rollingContexts  map[string]*rollingContext // serviceID -> rolling state
 	rollupWindows    map[string]map[timeutil.GranularityLevel]*rollupWindow
-	processingLocks  map[string]bool  // serviceID -> is currently processing
-	baseInstruction  string           // Base instruction
-	storage          *Storage         // Storage for saving annotated frames
-	db               *database.Client // Database for events
-	eventBroadcaster EventBroadcaster // For broadcasting events to subscribers
+	processingLocks  map[string]bool           // serviceID -> is currently processing
+	batchTimers      map[string]*time.Timer    // serviceID -> pending max-wait flush timer
+	sopCache         map[string]*sopCacheEntry // serviceID -> cached SOP instruction
+	baseInstruction  string                    // Base instruction
+	storage          *Storage                  // Storage for saving annotated frames
+	db               *database.Client          // Database for events
+	eventBroadcaster EventBroadcaster          // For broadcasting events to subscribers
 	mu               sync.Mutex
 }
 
 // NewBatchManager creates a new batch manager
-func NewBatchManager(client *FrameClient, batchSize int, storage *Storage, db *database.Client, broadcaster EventBroadcaster) *BatchManager {
+func NewBatchManager(client *FrameClient, batchSize int, maxBatchWait time.Duration, storage *Storage, db *database.Client, broadcaster EventBroadcaster) *BatchManager {
 	return &BatchManager{
 		client:          client,
 		batchSize:       batchSize,
+		maxBatchWait:    maxBatchWait,
 		frameBuffers:    make(map[string][]*Frame),
 		rollingContexts: make(map[string]*rollingContext),
 		rollupWindows:   make(map[string]map[timeutil.GranularityLevel]*rollupWindow),
 		processingLocks: make(map[string]bool),
+		batchTimers:     make(map[string]*time.Timer),
+		sopCache:        make(map[string]*sopCacheEntry),
 		baseInstruction: strings.Join([]string{
 			"Analyze these video frames for motion, action, emotion, facial expressions, and subtle details.",
 			"Detect the most important objects (MAX 10) and return bounding boxes in NORMALIZED 1000 COORDINATES (0=top/left, 1000=bottom/right).",
@@ -76,6 +93,7 @@ func NewBatchManager(client *FrameClient, batchSize int, storage *Storage, db *d
 // If not processing: grab all frames in buffer and send
 func (m *BatchManager) AddFrame(frame *Frame) {
 	m.mu.Lock()
+	defer m.mu.Unlock()
 
 	serviceID := frame.ServiceID
 
@@ -97,59 +115,97 @@ func (m *BatchManager) AddFrame(frame *Frame) {
 
 	m.frameBuffers[serviceID] = buffer
 
-	// Check if we should send a batch:
-	// 1. Buffer is full (== batchSize)
-	// 2. This service is not currently processing
-	shouldSend := len(buffer) == m.batchSize && !m.processingLocks[serviceID]
+	// Send immediately when the buffer is full and the service is idle
+	if len(buffer) == m.batchSize && !m.processingLocks[serviceID] {
+		m.flushServiceLocked(serviceID)
+		return
+	}
 
-	if shouldSend {
-		// Grab all frames from buffer
-		framesToSend := make([]*Frame, len(buffer))
-		copy(framesToSend, buffer)
+	if m.processingLocks[serviceID] {
+		log.Printf("[BatchManager] Buffering frame for service %s (currently processing, %d frames in buffer)", serviceID, len(buffer))
+	}
 
-		// Clear the buffer
-		m.frameBuffers[serviceID] = nil
+	// Dynamic batching: arm the max-wait timer so a partially filled buffer
+	// is sent after maxBatchWait instead of waiting indefinitely for a full
+	// batch
+	m.scheduleFlushLocked(serviceID)
+}
 
-		// Get or create context
-		rollCtx := m.rollingContexts[serviceID]
-		if rollCtx == nil {
-			rollCtx = &rollingContext{}
-			m.rollingContexts[serviceID] = rollCtx
-		}
+// flushServiceLocked grabs all buffered frames for a service and dispatches
+// them to the VLM. No-op if the buffer is empty or the service is already
+// processing. Caller must hold m.mu.
+func (m *BatchManager) flushServiceLocked(serviceID string) {
+	buffer := m.frameBuffers[serviceID]
+	if len(buffer) == 0 || m.processingLocks[serviceID] {
+		return
+	}
 
-		// Store last frame for next batch and capture send timestamp
-		newLastFrame := framesToSend[len(framesToSend)-1]
-		batchSentTime := time.Now().UnixNano()
+	// Grab all frames from buffer
+	framesToSend := make([]*Frame, len(buffer))
+	copy(framesToSend, buffer)
 
-		// Snapshot context data for async goroutine (copy values before unlocking)
-		prevResponse := rollCtx.previousResponse
-		prevLastFrame := rollCtx.lastFrame
+	// Clear the buffer
+	m.frameBuffers[serviceID] = nil
 
-		// Update context
-		rollCtx.lastFrame = newLastFrame
-		rollCtx.lastBatchSentTime = batchSentTime
+	// Cancel any pending max-wait timer (the batch is going out now)
+	if t := m.batchTimers[serviceID]; t != nil {
+		t.Stop()
+		delete(m.batchTimers, serviceID)
+	}
 
-		// Mark service as processing
-		m.processingLocks[serviceID] = true
+	// Get or create context
+	rollCtx := m.rollingContexts[serviceID]
+	if rollCtx == nil {
+		rollCtx = &rollingContext{}
+		m.rollingContexts[serviceID] = rollCtx
+	}
 
-		m.mu.Unlock()
+	// Store last frame for next batch and capture send timestamp
+	newLastFrame := framesToSend[len(framesToSend)-1]
+	batchSentTime := time.Now().UnixNano()
 
-		// Send batch asynchronously to avoid blocking
-		go m.sendBatch(serviceID, framesToSend, prevResponse, prevLastFrame, batchSentTime)
-	} else {
-		if m.processingLocks[serviceID] {
-			log.Printf("[BatchManager] Buffering frame for service %s (currently processing, %d frames in buffer)", serviceID, len(buffer))
-		}
-		m.mu.Unlock()
+	// Snapshot context data for async goroutine (copy values under the lock)
+	prevResponse := rollCtx.previousResponse
+	prevLastFrame := rollCtx.lastFrame
+
+	// Update context
+	rollCtx.lastFrame = newLastFrame
+	rollCtx.lastBatchSentTime = batchSentTime
+
+	// Mark service as processing
+	m.processingLocks[serviceID] = true
+
+	// Send batch asynchronously to avoid blocking
+	go m.sendBatch(serviceID, framesToSend, prevResponse, prevLastFrame, batchSentTime)
+}
+
+// scheduleFlushLocked arms the max-wait flush timer for a service if frames
+// are buffered and no timer is already pending. Caller must hold m.mu.
+func (m *BatchManager) scheduleFlushLocked(serviceID string) {
+	if m.maxBatchWait <= 0 || m.batchTimers[serviceID] != nil || len(m.frameBuffers[serviceID]) == 0 {
+		return
 	}
+
+	m.batchTimers[serviceID] = time.AfterFunc(m.maxBatchWait, func() {
+		m.mu.Lock()
+		defer m.mu.Unlock()
+		delete(m.batchTimers, serviceID)
+		if len(m.frameBuffers[serviceID]) > 0 && !m.processingLocks[serviceID] {
+			log.Printf("[BatchManager] Max batch wait reached for service %s, sending partial batch (%d frames)",
+				serviceID, len(m.frameBuffers[serviceID]))
+			m.flushServiceLocked(serviceID)
+		}
+	})
 }
 
 // sendBatch sends a batch of frames to vLLM with rolling context
 func (m *BatchManager) sendBatch(serviceID string, frames []*Frame, previousResponse *VLMResponse, lastFrame *Frame, batchSentTime int64) {
-	// Release the processing lock when done
+	// Release the processing lock when done and rearm the max-wait timer for
+	// any frames that were buffered while this batch was processing
 	defer func() {
 		m.mu.Lock()
 		delete(m.processingLocks, serviceID)
+		m.scheduleFlushLocked(serviceID)
 		m.mu.Unlock()
 	}()
 	// Build instruction from base + SOP procedures + optional previous response context.
@@ -205,6 +261,20 @@ func (m *BatchManager) sendBatch(serviceID string, frames []*Frame, previousResp
 			return
 		}
 
+		// Annotate the last frame concurrently with event creation below -
+		// the two stages are independent, and annotation (JPEG decode +
+		// encode) otherwise waits behind DB writes and rollup aggregation
+		finalFrame := framesToSend[len(framesToSend)-1]
+		annotatedCh := make(chan []byte, 1)
+		go func() {
+			annotatedData, err := AnnotateFrame(finalFrame.Data, &vlmResp)
+			if err != nil {
+				log.Printf("[BatchManager] Failed to annotate frame: %v", err)
+				annotatedData = finalFrame.Data // fall back to original
+			}
+			annotatedCh <- annotatedData
+		}()
+
 		// Create event for VLM indexing with structured data
 		if m.db != nil {
 			// Convert VLMResponse struct to map via JSON round-trip for structpb compatibility
@@ -224,18 +294,16 @@ func (m *BatchManager) sendBatch(serviceID string, frames []*Frame, previousResp
 				if _, err := m.createAndBroadcastEvent(serviceID, granularity, firstFrame.Timestamp, lastFrame.Timestamp, responseMap); err != nil {
 					log.Printf("[BatchManager] Failed to create %s event: %v", granularity, err)
 				} else {
-					m.maybeBuildHigherGranularity(serviceID, granularity, firstFrame.Timestamp, lastFrame.Timestamp)
+					// Rollup aggregation may issue its own VLM calls; run it
+					// off the batch path so the processing lock releases and
+					// the next batch isn't serialized behind it.
+					go m.maybeBuildHigherGranularity(serviceID, granularity, firstFrame.Timestamp, lastFrame.Timestamp)
 				}
 			}
 		}
 
-		// Annotate the last frame with bounding boxes
-		finalFrame := framesToSend[len(framesToSend)-1]
-		annotatedData, err := AnnotateFrame(finalFrame.Data, newResponseStr)
-		if err != nil {
-			log.Printf("[BatchManager] Failed to annotate frame: %v", err)
-			annotatedData = finalFrame.Data // fall back to original
-		}
+		// Collect the annotated frame (bounding boxes drawn on the last frame)
+		annotatedData := <-annotatedCh
 
 		// Save annotated frame to disk (replaces the preprocessed-only version)
 		// This goes to the same storage/frames/{serviceID}/ directory
@@ -273,11 +341,33 @@ func (m *BatchManager) sendBatch(serviceID string, frames []*Frame, previousResp
 	}
 }
 
+// buildSOPInstruction returns the SOP prompt section for a service, cached
+// for sopCacheTTL to avoid re-querying the DB on every batch
 func (m *BatchManager) buildSOPInstruction(serviceID string) string {
 	if m.db == nil {
 		return ""
 	}
 
+	m.mu.Lock()
+	if entry := m.sopCache[serviceID]; entry != nil && time.Since(entry.fetchedAt) < sopCacheTTL {
+		text := entry.text
+		m.mu.Unlock()
+		return text
+	}
+	m.mu.Unlock()
+
+	text := m.renderSOPInstruction(serviceID)
+
+	m.mu.Lock()
+	m.sopCache[serviceID] = &sopCacheEntry{text: text, fetchedAt: time.Now()}
+	m.mu.Unlock()
+
+	return text
+}
+
+// renderSOPInstruction loads SOP procedures from the DB and renders the
+// prompt section
+func (m *BatchManager) renderSOPInstruction(serviceID string) string {
 	svc, err := m.db.GetService(serviceID)
 	if err != nil || svc == nil || svc.NodeId == "" {
 		return ""
@@ -355,75 +445,88 @@ func (m *BatchManager) maybeBuildHigherGranularity(serviceID string, lowerGranul
 	lowerEvents, err := m.db.ListVLMEventsByGranularityRange(serviceID, string(lowerGranularity), windowFrom, windowTo)
 	if err != nil {
 		log.Printf("[BatchManager] Failed loading %s events for %s rollup: %v", lowerGranularity, nextGranularity, err)
+		m.restoreRollupWindow(serviceID, lowerGranularity, windowFrom, windowTo)
 		return
 	}
 	if len(lowerEvents) == 0 {
+		m.restoreRollupWindow(serviceID, lowerGranularity, windowFrom, windowTo)
 		return
 	}
 
 	aggregatedResp, err := m.aggregateLowerEventsWithVLM(serviceID, lowerGranularity, nextGranularity, windowFrom, windowTo, lowerEvents)
 	if err != nil {
 		log.Printf("[BatchManager] Failed aggregating %s -> %s: %v", lowerGranularity, nextGranularity, err)
+		m.restoreRollupWindow(serviceID, lowerGranularity, windowFrom, windowTo)
 		return
 	}
 
 	if _, err := m.createAndBroadcastEvent(serviceID, nextGranularity, windowFrom, windowTo, aggregatedResp); err != nil {
 		log.Printf("[BatchManager] Failed to create %s rollup event: %v", nextGranularity, err)
+		m.restoreRollupWindow(serviceID, lowerGranularity, windowFrom, windowTo)
 		return
 	}
-	m.clearRollupWindow(serviceID, lowerGranularity)
 
 	// Feed the produced higher-level event into the next rollup tier.
 	m.maybeBuildHigherGranularity(serviceID, nextGranularity, windowFrom, windowTo)
 }
 
 // extendRollupWindow extends or initializes the rollup window for one service + lower granularity.
-// It returns ready=true when the accumulated span reaches thresholdSeconds.
+// When the accumulated span reaches thresholdSeconds it deletes the window and returns ready=true,
+// atomically claiming the span so concurrent rollup goroutines never aggregate it twice.
 func (m *BatchManager) extendRollupWindow(serviceID string, lowerGranularity timeutil.GranularityLevel, batchFrom, batchTo time.Time, thresholdSeconds int64) (time.Time, time.Time, bool) {
 	m.mu.Lock()
 	defer m.mu.Unlock()
 
-	windowsByGranularity := m.rollupWindows[serviceID]
-	if windowsByGranularity == nil {
-		windowsByGranularity = make(map[timeutil.GranularityLevel]*rollupWindow)
-		m.rollupWindows[serviceID] = windowsByGranularity
-	}
-
-	win := windowsByGranularity[lowerGranularity]
-	if win == nil {
-		win = &rollupWindow{
-			from: batchFrom,
-			to:   batchTo,
-		}
-		windowsByGranularity[lowerGranularity] = win
-	} else {
-		if batchFrom.Before(win.from) {
-			win.from = batchFrom
-		}
-		if batchTo.After(win.to) {
-			win.to = batchTo
-		}
-	}
+	win := m.mergeRollupWindowLocked(serviceID, lowerGranularity, batchFrom, batchTo)
 
 	if win.to.Sub(win.from) < time.Duration(thresholdSeconds)*time.Second {
 		return win.from, win.to, false
 	}
 
+	windowsByGranularity := m.rollupWindows[serviceID]
+	delete(windowsByGranularity, lowerGranularity)
+	if len(windowsByGranularity) == 0 {
+		delete(m.rollupWindows, serviceID)
+	}
 	return win.from, win.to, true
 }
 
-func (m *BatchManager) clearRollupWindow(serviceID string, granularity timeutil.GranularityLevel) {
+// restoreRollupWindow merges a claimed span back into the rollup window after
+// a failed rollup, so the next batch retries it instead of the span being
+// lost. Only the goroutine that claimed the span calls this, which keeps the
+// claim in extendRollupWindow atomic.
+func (m *BatchManager) restoreRollupWindow(serviceID string, lowerGranularity timeutil.GranularityLevel, from, to time.Time) {
 	m.mu.Lock()
 	defer m.mu.Unlock()
 
+	m.mergeRollupWindowLocked(serviceID, lowerGranularity, from, to)
+}
+
+// mergeRollupWindowLocked extends or initializes the window for one service +
+// lower granularity. Caller must hold m.mu.
+func (m *BatchManager) mergeRollupWindowLocked(serviceID string, lowerGranularity timeutil.GranularityLevel, from, to time.Time) *rollupWindow {
 	windowsByGranularity := m.rollupWindows[serviceID]
 	if windowsByGranularity == nil {
-		return
+		windowsByGranularity = make(map[timeutil.GranularityLevel]*rollupWindow)
+		m.rollupWindows[serviceID] = windowsByGranularity
 	}
-	delete(windowsByGranularity, granularity)
-	if len(windowsByGranularity) == 0 {
-		delete(m.rollupWindows, serviceID)
+
+	win := windowsByGranularity[lowerGranularity]
+	if win == nil {
+		win = &rollupWindow{
+			from: from,
+			to:   to,
+		}
+		windowsByGranularity[lowerGranularity] = win
+	} else {
+		if from.Before(win.from) {
+			win.from = from
+		}
+		if to.After(win.to) {
+			win.to = to
+		}
 	}
+	return win
 }
 
 func (m *BatchManager) aggregateLowerEventsWithVLM(serviceID string, lowerGranularity, nextGranularity timeutil.GranularityLevel, from, to time.Time, lowerEvents []*servicev1.Event) (map[string]any, error) {
@@ -502,38 +605,8 @@ func (m *BatchManager) Flush() {
 	m.mu.Lock()
 	defer m.mu.Unlock()
 
-	for serviceID, buffer := range m.frameBuffers {
-		if len(buffer) > 0 && !m.processingLocks[serviceID] {
-			framesToSend := make([]*Frame, len(buffer))
-			copy(framesToSend, buffer)
-
-			// Clear buffer
-			m.frameBuffers[serviceID] = nil
-
-			// Get or create context
-			rollCtx := m.rollingContexts[serviceID]
-			if rollCtx == nil {
-				rollCtx = &rollingContext{}
-				m.rollingContexts[serviceID] = rollCtx
-			}
-
-			// Store last frame and capture send timestamp
-			newLastFrame := framesToSend[len(framesToSend)-1]
-			batchSentTime := time.Now().UnixNano()
-
-			// Snapshot context data for async goroutine
-			prevResponse := rollCtx.previousResponse
-			prevLastFrame := rollCtx.lastFrame
-
-			// Update context
-			rollCtx.lastFrame = newLastFrame
-			rollCtx.lastBatchSentTime = batchSentTime
-
-			// Mark service as processing
-			m.processingLocks[serviceID] = true
-
-			go m.sendBatch(serviceID, framesToSend, prevResponse, prevLastFrame, batchSentTime)
-		}
+	for serviceID := range m.frameBuffers {
+		m.flushServiceLocked(serviceID)
 	}
 }
 
@@ -570,6 +643,7 @@ func (m *BatchManager) ResetSummary(serviceID string) {
 	defer m.mu.Unlock()
 	delete(m.rollingContexts, serviceID)
 	delete(m.rollupWindows, serviceID)
+	delete(m.sopCache, serviceID)
 	log.Printf("[BatchManager] Reset rolling context for service %s", serviceID)
 }
 
@@ -582,5 +656,10 @@ func (m *BatchManager) RemoveService(serviceID string) {
 	delete(m.rollingContexts, serviceID)
 	delete(m.rollupWindows, serviceID)
 	delete(m.processingLocks, serviceID)
+	if t := m.batchTimers[serviceID]; t != nil {
+		t.Stop()
+		delete(m.batchTimers, serviceID)
+	}
+	delete(m.sopCache, serviceID)
 	log.Printf("[BatchManager] Removed service %s (freed buffer and context)", serviceID)
 }
@@ -5,25 +5,42 @@ import (
 	"encoding/base64"
 	"fmt"
 	"log"
+	"strings"
 	"time"
 
 	"github.com/openai/openai-go/v3"
 	"github.com/openai/openai-go/v3/option"
+
+	"github.com/zapdos-labs/unblink/server/internal/httputil"
 )
 
 // FrameClient handles communication with vLLM endpoints (OpenAI-compatible)
 type FrameClient struct {
-	client      *openai.Client
-	Model       string
-	timeout     time.Duration
-	baseURL     string
-	instruction string // Static instruction for all requests
+	client         *openai.Client
+	Model          string
+	timeout        time.Duration
+	baseURL        string
+	instruction    string // Static instruction for all requests
+	maxTokens      int    // Completion token budget per request
+	responseSchema any    // VLMResponse JSON schema, reflected once at construction
 }
 
+// defaultMaxTokens bounds completion length when no budget is configured.
+// Decode cost scales with the budget when the model rambles, so keep this
+// sized for a structured response (10 objects + description), not the model
+// context limit.
+const defaultMaxTokens = 2048
+
 // NewFrameClient creates a new frame client for vLLM communication
-func NewFrameClient(baseURL, Model, apiKey string, timeout time.Duration, instruction string) *FrameClient {
+// maxTokens caps completion length per request (<=0 uses defaultMaxTokens)
+func NewFrameClient(baseURL, Model, apiKey string, timeout time.Duration, maxTokens int, instruction string) *FrameClient {
+	// Share one pooled HTTP client so concurrent batch requests (one per
+	// service) reuse keep-alive connections instead of opening a fresh
+	// TCP+TLS connection per request. Timeout per request is handled via
+	// context in the send methods.
 	opts := []option.RequestOption{
 		option.WithAPIKey(apiKey),
+		option.WithHTTPClient(httputil.NewPooledClient(0)),
 	}
 
 	if baseURL != "" {
@@ -32,12 +49,20 @@ func NewFrameClient(baseURL, Model, apiKey string, timeout time.Duration, instru
 
 	client := openai.NewClient(opts...)
 
+	if maxTokens <= 0 {
+		maxTokens = defaultMaxTokens
+	}
+
 	return &FrameClient{
 		client:      &client,
 		Model:       Model,
 		timeout:     timeout,
 		baseURL:     baseURL,
 		instruction: instruction,
+		maxTokens:   maxTokens,
+		// The response schema never changes, so pay for the jsonschema
+		// reflection once here instead of on every request
+		responseSchema: GenerateVLMResponseSchema(),
 	}
 }
 
@@ -64,11 +89,10 @@ func (c *FrameClient) SendTextWithStructuredOutput(ctx context.Context, instruct
 		return nil, fmt.Errorf("empty text payload")
 	}
 
-	schema := GenerateVLMResponseSchema()
 	schemaParam := openai.ResponseFormatJSONSchemaJSONSchemaParam{
 		Name:        "vlm_response",
 		Description: openai.String("Video event aggregation with detected objects and detailed description"),
-		Schema:      schema,
+		Schema:      c.responseSchema,
 		Strict:      openai.Bool(true),
 	}
 
@@ -77,7 +101,7 @@ func (c *FrameClient) SendTextWithStructuredOutput(ctx context.Context, instruct
 		Messages: []openai.ChatCompletionMessageParamUnion{
 			openai.UserMessage(content),
 		},
-		MaxTokens: openai.Int(int64(6000)),
+		MaxTokens: openai.Int(int64(c.maxTokens)),
 		ResponseFormat: openai.ChatCompletionNewParamsResponseFormatUnion{
 			OfJSONSchema: &openai.ResponseFormatJSONSchemaParam{JSONSchema: schemaParam},
 		},
@@ -97,6 +121,24 @@ func (c *FrameClient) SendTextWithStructuredOutput(ctx context.Context, instruct
 	return response, nil
 }
 
+// frameDataURL builds the data: URL for a JPEG frame in a single allocation.
+// EncodeToString followed by Sprintf copied the multi-hundred-KB base64
+// payload twice per frame; with several frames per batch that is real
+// allocator and memory-bandwidth pressure on every request.
+func frameDataURL(jpegData []byte) string {
+	const prefix = "data:image/jpeg;base64,"
+
+	var b strings.Builder
+	b.Grow(len(prefix) + base64.StdEncoding.EncodedLen(len(jpegData)))
+	b.WriteString(prefix)
+
+	enc := base64.NewEncoder(base64.StdEncoding, &b)
+	_, _ = enc.Write(jpegData)
+	_ = enc.Close()
+
+	return b.String()
+}
+
 // SendFrameBatchWithStructuredOutput sends frames with structured output using response_format
 func (c *FrameClient) SendFrameBatchWithStructuredOutput(ctx context.Context, frames []*Frame, instruction string) (*openai.ChatCompletion, error) {
 	if len(frames) == 0 {
@@ -113,21 +155,16 @@ func (c *FrameClient) SendFrameBatchWithStructuredOutput(ctx context.Context, fr
 
 	// Add images
 	for _, frame := range frames {
-		// Encode JPEG to base64
-		base64Data := base64.StdEncoding.EncodeToString(frame.Data)
-		dataURL := fmt.Sprintf("data:image/jpeg;base64,%s", base64Data)
-
 		content = append(content, openai.ImageContentPart(openai.ChatCompletionContentPartImageImageURLParam{
-			URL: dataURL,
+			URL: frameDataURL(frame.Data),
 		}))
 	}
 
-	// Build JSON schema for structured output
-	schema := GenerateVLMResponseSchema()
+	// Build structured output format from the cached schema
 	schemaParam := openai.ResponseFormatJSONSchemaJSONSchemaParam{
 		Name:        "vlm_response",
 		Description: openai.String("Video frame analysis with detected objects and detailed description"),
-		Schema:      schema,
+		Schema:      c.responseSchema,
 		Strict:      openai.Bool(true),
 	}
 
@@ -137,7 +174,7 @@ func (c *FrameClient) SendFrameBatchWithStructuredOutput(ctx context.Context, fr
 		Messages: []openai.ChatCompletionMessageParamUnion{
 			openai.UserMessage(content),
 		},
-		MaxTokens: openai.Int(int64(6000)),
+		MaxTokens: openai.Int(int64(c.maxTokens)),
 		ResponseFormat: openai.ChatCompletionNewParamsResponseFormatUnion{
 			OfJSONSchema: &openai.ResponseFormatJSONSchemaParam{JSONSchema: schemaParam},
 		},
@@ -154,12 +191,11 @@ func (c *FrameClient) SendFrameBatchWithStructuredOutput(ctx context.Context, fr
 	}
 	duration := time.Since(startTime)
 
+	// Log request stats only; dumping the full response content per request
+	// is O(payload) formatting on a hot path (the parsed response is
+	// persisted as an event anyway)
 	log.Printf("[FrameClient] Request successful: duration=%v, frames=%d, tokens=%d",
 		duration, len(frames), response.Usage.TotalTokens)
 
-	if len(response.Choices) > 0 {
-		log.Printf("[FrameClient] Response content: %s", response.Choices[0].Message.Content)
-	}
-
 	return response, nil
 }
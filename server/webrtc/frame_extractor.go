@@ -174,14 +174,8 @@ func (e *FrameExtractor) readFramesFromFFmpeg() {
 	defer e.wg.Done() // Signal completion
 	defer log.Printf("[FrameExtractor] Stopped JPEG reader for service %s", e.serviceID)
 
-	// JPEG SOI (Start of Image) marker
-	soi := []byte{0xFF, 0xD8}
-	// JPEG EOI (End of Image) marker
-	eoi := []byte{0xFF, 0xD9}
-
 	var frameBuffer bytes.Buffer
 	buf := make([]byte, 4096)
-	inFrame := false
 
 	log.Printf("[FrameExtractor] Starting to read JPEG frames from FFmpeg for service %s", e.serviceID)
 
@@ -203,49 +197,68 @@ func (e *FrameExtractor) readFramesFromFFmpeg() {
 			return
 		}
 
-		for i := 0; i < n; i++ {
-			b := buf[i]
-			frameBuffer.WriteByte(b)
-
-			// Check for SOI marker
-			if frameBuffer.Len() >= 2 {
-				last2 := frameBuffer.Bytes()[frameBuffer.Len()-2:]
-				if bytes.Equal(last2, soi) && !inFrame {
-					inFrame = true
-					frameBuffer.Reset()
-					frameBuffer.Write(soi)
-				}
+		frameBuffer.Write(buf[:n])
+
+		for _, frameData := range scanJPEGFrames(&frameBuffer) {
+			frame := &Frame{
+				Data:      frameData,
+				Timestamp: time.Now(),
+				ServiceID: e.serviceID,
 			}
 
-			// Check for EOI marker
-			if inFrame && frameBuffer.Len() >= 2 {
-				last2 := frameBuffer.Bytes()[frameBuffer.Len()-2:]
-				if bytes.Equal(last2, eoi) {
-					// Complete JPEG frame
-					frameData := make([]byte, frameBuffer.Len())
-					copy(frameData, frameBuffer.Bytes())
-
-					// Create frame
-					frame := &Frame{
-						Data:      frameData,
-						Timestamp: time.Now(),
-						ServiceID: e.serviceID,
-					}
-
-					log.Printf("[FrameExtractor] Extracted JPEG frame (%d bytes)", len(frameData))
-
-					// Call callback
-					if e.onFrame != nil {
-						e.onFrame(frame)
-					}
-
-					// Reset for next frame
-					frameBuffer.Reset()
-					inFrame = false
-				}
+			if e.onFrame != nil {
+				e.onFrame(frame)
+			}
+		}
+	}
+}
+
+// scanJPEGFrames extracts all complete SOI..EOI JPEG frames from frameBuffer,
+// scanning with bytes.Index rather than comparing the buffer tail byte by
+// byte. Scanned bytes are consumed from the buffer; a partial frame (or a
+// trailing 0xFF that could be the first half of a marker split across reads)
+// stays buffered for the next call.
+func scanJPEGFrames(frameBuffer *bytes.Buffer) [][]byte {
+	// JPEG SOI (Start of Image) marker
+	soi := []byte{0xFF, 0xD8}
+	// JPEG EOI (End of Image) marker
+	eoi := []byte{0xFF, 0xD9}
+
+	var frames [][]byte
+	data := frameBuffer.Bytes()
+	scanned := 0
+	for {
+		soiIdx := bytes.Index(data[scanned:], soi)
+		if soiIdx < 0 {
+			// No frame start in the remainder; keep a trailing 0xFF in
+			// case an SOI marker is split across reads.
+			scanned = len(data)
+			if scanned > 0 && data[scanned-1] == 0xFF {
+				scanned--
 			}
+			break
 		}
+		soiIdx += scanned
+
+		eoiIdx := bytes.Index(data[soiIdx+2:], eoi)
+		if eoiIdx < 0 {
+			// Partial frame; keep it buffered until the EOI arrives.
+			scanned = soiIdx
+			break
+		}
+		end := soiIdx + 2 + eoiIdx + 2
+
+		frameData := make([]byte, end-soiIdx)
+		copy(frameData, data[soiIdx:end])
+		frames = append(frames, frameData)
+
+		scanned = end
 	}
+
+	// Discard everything already scanned so the buffer only holds the
+	// unconsumed tail.
+	frameBuffer.Next(scanned)
+	return frames
 }
 
 // Close stops the frame extractor
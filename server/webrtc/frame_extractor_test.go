@@ -0,0 +1,93 @@
+package webrtc
+
+import (
+	"bytes"
+	"testing"
+)
+
+// jpegFrame wraps a body in SOI/EOI markers like FFmpeg's image2pipe output.
+func jpegFrame(body ...byte) []byte {
+	frame := []byte{0xFF, 0xD8}
+	frame = append(frame, body...)
+	return append(frame, 0xFF, 0xD9)
+}
+
+func concat(parts ...[]byte) []byte {
+	var out []byte
+	for _, p := range parts {
+		out = append(out, p...)
+	}
+	return out
+}
+
+// chunked splits data into chunks of at most size bytes, simulating how the
+// stream arrives over many pipe reads.
+func chunked(data []byte, size int) [][]byte {
+	var chunks [][]byte
+	for len(data) > size {
+		chunks = append(chunks, data[:size])
+		data = data[size:]
+	}
+	return append(chunks, data)
+}
+
+func TestScanJPEGFrames(t *testing.T) {
+	frameA := jpegFrame(0x01, 0x02, 0x03)
+	frameB := jpegFrame(0x04, 0x05)
+	long := jpegFrame(bytes.Repeat([]byte{0x10, 0x20, 0x30}, 32)...)
+
+	tests := []struct {
+		name   string
+		chunks [][]byte
+		want   [][]byte
+	}{
+		{
+			name:   "multiple frames in one read",
+			chunks: [][]byte{concat(frameA, frameB)},
+			want:   [][]byte{frameA, frameB},
+		},
+		{
+			name:   "SOI split across reads",
+			chunks: [][]byte{frameA[:1], frameA[1:]},
+			want:   [][]byte{frameA},
+		},
+		{
+			name:   "EOI split across reads",
+			chunks: [][]byte{frameA[:len(frameA)-1], frameA[len(frameA)-1:]},
+			want:   [][]byte{frameA},
+		},
+		{
+			name:   "garbage between frames",
+			chunks: [][]byte{concat(frameA, []byte{0x00, 0x7F, 0xFF}, frameB)},
+			want:   [][]byte{frameA, frameB},
+		},
+		{
+			name:   "frame spanning many reads",
+			chunks: chunked(long, 7),
+			want:   [][]byte{long},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var buf bytes.Buffer
+			var got [][]byte
+			for _, chunk := range tt.chunks {
+				buf.Write(chunk)
+				got = append(got, scanJPEGFrames(&buf)...)
+			}
+
+			if len(got) != len(tt.want) {
+				t.Fatalf("got %d frames, want %d", len(got), len(tt.want))
+			}
+			for i := range got {
+				if !bytes.Equal(got[i], tt.want[i]) {
+					t.Fatalf("frame %d = % X, want % X", i, got[i], tt.want[i])
+				}
+			}
+			if buf.Len() != 0 {
+				t.Fatalf("expected buffer drained after last frame, %d bytes left", buf.Len())
+			}
+		})
+	}
+}
@@ -14,7 +14,23 @@ import (
 	"golang.org/x/image/font/gofont/goregular"
 )
 
-// PreprocessFrame resizes the frame (max edge = 800px, maintaining aspect ratio) and burns in the timestamp
+// vlmPatchSize is the vision patch grid of Qwen-VL class models (14px patches
+// with 2x2 merge = 28px). Sending frames whose dimensions are already
+// multiples of this lets the model server skip its own resize pass.
+const vlmPatchSize = 28
+
+// alignToPatchGrid rounds a dimension to the nearest multiple of vlmPatchSize
+// (minimum one patch)
+func alignToPatchGrid(d int) int {
+	aligned := (d + vlmPatchSize/2) / vlmPatchSize * vlmPatchSize
+	if aligned < vlmPatchSize {
+		return vlmPatchSize
+	}
+	return aligned
+}
+
+// PreprocessFrame resizes the frame (max edge = 800px, maintaining aspect ratio,
+// rounded to the VLM patch grid) and burns in the timestamp
 // Returns the preprocessed JPEG data
 func PreprocessFrame(frameData []byte, timestamp time.Time) ([]byte, error) {
 	// Decode JPEG
@@ -51,9 +67,19 @@ func PreprocessFrame(frameData []byte, timestamp time.Time) ([]byte, error) {
 		}
 	}
 
+	// Round both edges to the patch grid so the VLM ingests the frame
+	// without a second resize on the serving side. The aspect ratio shift
+	// is at most half a patch per edge.
+	newWidth = alignToPatchGrid(newWidth)
+	newHeight = alignToPatchGrid(newHeight)
+
 	// Resize maintaining aspect ratio
+	// ApproxBiLinear is several times faster than CatmullRom and the quality
+	// difference is negligible for VLM input (frames are re-encoded at
+	// quality 85 anyway). This runs once per extracted frame, so it is the
+	// dominant CPU cost of preprocessing.
 	resized := image.NewRGBA(image.Rect(0, 0, newWidth, newHeight))
-	draw.CatmullRom.Scale(resized, resized.Bounds(), img, img.Bounds(), draw.Over, nil)
+	draw.ApproxBiLinear.Scale(resized, resized.Bounds(), img, img.Bounds(), draw.Over, nil)
 
 	// Burn in timestamp
 	timestampStr := timestamp.Format("2006-01-02 15:04:05.000 MST")
@@ -2,7 +2,6 @@ package shared
 
 import (
 	"fmt"
-	"reflect"
 
 	"github.com/fxamacker/cbor/v2"
 )
@@ -162,36 +161,40 @@ func EncodeMessage(msg any) ([]byte, error) {
 	return cbor.Marshal(msg)
 }
 
+// messageConstructors maps message types to constructors. Built once at
+// package level so DecodeMessage doesn't rebuild the map (and go through
+// reflection) for every message - BridgeData messages arrive at video
+// bitrate, so per-message overhead here is on the hot path.
+var messageConstructors = map[string]func() any{
+	MessageTypeTokenCheckRequest:   func() any { return &TokenCheckRequest{} },
+	MessageTypeTokenCheckResponse:  func() any { return &TokenCheckResponse{} },
+	MessageTypeNewTokenRequest:     func() any { return &NewTokenRequest{} },
+	MessageTypeNewTokenResponse:    func() any { return &NewTokenResponse{} },
+	MessageTypeRegisterRequest:     func() any { return &RegisterRequest{} },
+	MessageTypeRegisterResponse:    func() any { return &RegisterResponse{} },
+	MessageTypeNodeReady:           func() any { return &NodeReadyMessage{} },
+	MessageTypeOpenBridgeRequest:   func() any { return &OpenBridgeRequest{} },
+	MessageTypeOpenBridgeResponse:  func() any { return &OpenBridgeResponse{} },
+	MessageTypeCloseBridgeRequest:  func() any { return &CloseBridgeRequest{} },
+	MessageTypeCloseBridgeResponse: func() any { return &CloseBridgeResponse{} },
+	MessageTypeBridgeData:          func() any { return &BridgeDataMessage{} },
+}
+
 func DecodeMessage(data []byte) (any, error) {
 	var header Message
 	if err := cbor.Unmarshal(data, &header); err != nil {
 		return nil, fmt.Errorf("decode message header: %w", err)
 	}
 
-	typeMap := map[string]any{
-		MessageTypeTokenCheckRequest:   &TokenCheckRequest{},
-		MessageTypeTokenCheckResponse:  &TokenCheckResponse{},
-		MessageTypeNewTokenRequest:     &NewTokenRequest{},
-		MessageTypeNewTokenResponse:    &NewTokenResponse{},
-		MessageTypeRegisterRequest:     &RegisterRequest{},
-		MessageTypeRegisterResponse:    &RegisterResponse{},
-		MessageTypeNodeReady:           &NodeReadyMessage{},
-		MessageTypeOpenBridgeRequest:   &OpenBridgeRequest{},
-		MessageTypeOpenBridgeResponse:  &OpenBridgeResponse{},
-		MessageTypeCloseBridgeRequest:  &CloseBridgeRequest{},
-		MessageTypeCloseBridgeResponse: &CloseBridgeResponse{},
-		MessageTypeBridgeData:          &BridgeDataMessage{},
-	}
-
-	prototype, ok := typeMap[header.Type]
+	newMessage, ok := messageConstructors[header.Type]
 	if !ok {
 		return nil, fmt.Errorf("unknown message type: %s", header.Type)
 	}
 
-	msgValue := reflect.New(reflect.TypeOf(prototype).Elem()).Interface()
-	if err := cbor.Unmarshal(data, msgValue); err != nil {
+	msg := newMessage()
+	if err := cbor.Unmarshal(data, msg); err != nil {
 		return nil, fmt.Errorf("decode %s: %w", header.Type, err)
 	}
 
-	return msgValue, nil
+	return msg, nil
 }